@@ -1 +1,79 @@
+import functools
 
+import numpy as np
+from numba import njit, types, from_dtype
+
+# Labels for the int8 codes written by the anomaly kernel
+ANOMALY_LABELS = np.array(["Normal", "High anomaly", "Low anomaly"])
+
+# Temperature dtypes produced by clean_weather_data; kernels are only built for these
+TEMPERATURE_DTYPES = (np.int16, np.float32)
+
+# fastmath without "nnan"/"ninf": the kernel relies on NaN for empty windows and a missing std
+FASTMATH_FLAGS = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+def _anomaly_signature(dtype):
+    # Input is typed read-only since pandas hands out read-only views of its columns
+    temperature = types.Array(from_dtype(np.dtype(dtype)), 1, "A", readonly=True)
+    result = types.Tuple((types.float32[:], types.int8[:], types.int64))
+    return result(temperature, types.int64)
+
+
+def _anomaly_kernel(temperature, window):
+    """Compute the rolling average and anomaly codes of a temperature array.
+
+    Returns (rolling_avg, labels, anomaly_count), where labels holds
+    0 for Normal, 1 for High anomaly and 2 for Low anomaly.
+    """
+    n = temperature.shape[0]
+
+    # Pass 1: Welford's online mean and (sample) variance
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        x = float(temperature[i])
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x - mean)
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    upper = mean + 2 * std
+    lower = mean - 2 * std
+
+    # Pass 2: rolling window sum and anomaly classification
+    rolling_avg = np.empty(n, dtype=np.float32)
+    labels = np.zeros(n, dtype=np.int8)
+    anomaly_count = 0
+    window_sum = 0.0
+    for i in range(n):
+        x = float(temperature[i])
+        window_sum += x
+        if i >= window:
+            window_sum -= float(temperature[i - window])
+        rolling_avg[i] = window_sum / window if i >= window - 1 else np.nan
+
+        if x > upper:
+            labels[i] = 1
+            anomaly_count += 1
+        elif x < lower:
+            labels[i] = 2
+            anomaly_count += 1
+
+    return rolling_avg, labels, anomaly_count
+
+
+def get_anomaly_kernel(dtype):
+    """Return the anomaly kernel compiled for temperature arrays of the given dtype.
+
+    Each dtype gets its own dispatcher with a single explicit signature,
+    built on first use and kept in a registry, so later calls skip both
+    compilation and Numba's signature lookup across dtypes.
+    """
+    return _build_anomaly_kernel(np.dtype(dtype))
+
+
+@functools.cache
+def _build_anomaly_kernel(dtype):
+    if dtype not in TEMPERATURE_DTYPES:
+        raise TypeError(f"Unsupported temperature dtype: {dtype}")
+    return njit(_anomaly_signature(dtype), cache=True, fastmath=FASTMATH_FLAGS)(_anomaly_kernel)
@@ -1,13 +1,41 @@
+import numpy as np
 import pandas as pd
 def clean_weather_data(df):
     if df.empty:
         print("No data to clean.")
         return df
 
-    df["temperature"] = pd.to_numeric(df["temperature"], errors="coerce")
-    df.dropna(inplace=True)
+    # Coerce both columns first, then drop invalid rows with a single combined mask
+    temp = pd.to_numeric(df["temperature"], errors="coerce", downcast="integer").to_numpy()
+    # An explicit format skips per-element format inference for the usual YYYY-MM-DD strings
+    date = pd.to_datetime(df["date"], format="%Y-%m-%d", errors="coerce", cache=True)
+    retry = date.isna() & df["date"].notna()
+    if retry.any():
+        # Only entries in some other format go through the slower inferring parser
+        date[retry] = pd.to_datetime(df["date"][retry], errors="coerce")
+    date = date.to_numpy()
+    valid = ~(np.isnan(temp) | pd.isna(date))
+    if "city" in df.columns:
+        valid &= df["city"].notna().to_numpy()
 
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
-    df.dropna(inplace=True)
+    removed = len(df) - np.count_nonzero(valid)
+    if removed:
+        print(f"{removed} invalid rows removed.")
 
-    return df
+    # Whole-degree readings within the int16 range are stored as int16; fractional or
+    # out-of-range readings fall back to float32 rather than being truncated or wrapped
+    temp = temp[valid]
+    int16_info = np.iinfo(np.int16)
+    fits_int16 = (
+        np.array_equal(temp, np.round(temp))
+        and (temp.size == 0 or (temp.min() >= int16_info.min and temp.max() <= int16_info.max))
+    )
+    temp = temp.astype(np.int16) if fits_int16 else temp.astype(np.float32)
+
+    df = df.iloc[valid].assign(temperature=temp, date=date[valid])
+    if "city" in df.columns:
+        # Few distinct cities: store them as small integer codes over a shared string table
+        df["city"] = df["city"].astype("category")
+
+    order = np.argsort(df["date"].to_numpy(), kind="stable")
+    return df.iloc[order].reset_index(drop=True)
@@ -1,24 +1,21 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
+from analysis import get_anomaly_kernel, ANOMALY_LABELS, TEMPERATURE_DTYPES
+from datacleaning import clean_weather_data
 
 
 def create_mock_data():
     """Generates random data for testing if web scraping fails."""
     print("⚠️ Warning: Could not fetch real data, generating 'Mock Data' for testing...")
-    dates = [datetime.today() - timedelta(days=x) for x in range(30)]
-    temps = [random.randint(-5, 35) for _ in range(30)]
-    cities = ["İstanbul", "Ankara", "İzmir"] * 10  # Repeat cities for mock data
-   
-    date_strings = [d.strftime("%Y-%m-%d") for d in dates]
+    n = 30
+    dates = pd.date_range(end=datetime.today().date(), periods=n).strftime("%Y-%m-%d").to_numpy()
+    temps = np.random.default_rng().integers(-5, 36, size=n)
+    cities = np.tile(np.array(["İstanbul", "Ankara", "İzmir"]), n // 3 + 1)[:n]  # Repeat cities for mock data
+    
     return pd.DataFrame({
         "city": cities,
-        "date": date_strings, 
+        "date": dates, 
         "temperature": temps
     })
 
@@ -36,30 +33,6 @@ def scrape_weather():
         return create_mock_data() 
 
 
-def clean_weather_data(df):
-    if df.empty:
-        print("No data to clean.")
-        return df
-
-    
-    df["temperature"] = pd.to_numeric(df["temperature"], errors="coerce")
-    
-    
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
-    
-    
-    original_len = len(df)
-    df.dropna(inplace=True)
-    
-    if len(df) < original_len:
-        print(f"{original_len - len(df)} invalid rows removed.")
-
-    
-    df.sort_values(by="date", inplace=True)
-    
-    return df
-
-
 def statistical_summary(df):
     print("\n--- Statistical Summary ---")
     print(f"Total data points: {len(df)}")
@@ -70,7 +43,23 @@ def statistical_summary(df):
         
         # Show statistics by city
         print("\n--- Temperature Statistics by City ---")
-        city_stats = df.groupby('city')['temperature'].agg(['mean', 'min', 'max', 'count'])
+        # Sort once by city code, then reduce each contiguous city run with ufunc.reduceat
+        codes = df['city'].cat.codes.to_numpy()
+        order = np.argsort(codes, kind="stable")
+        codes_sorted = codes[order]
+        temps_sorted = df['temperature'].to_numpy()[order]
+        if len(temps_sorted) > 0:
+            starts = np.concatenate(([0], np.flatnonzero(codes_sorted[1:] != codes_sorted[:-1]) + 1))
+            counts = np.diff(np.append(starts, len(temps_sorted)))
+            city_stats = pd.DataFrame({
+                'mean': np.add.reduceat(temps_sorted, starts, dtype=np.float64) / counts,
+                'min': np.minimum.reduceat(temps_sorted, starts),
+                'max': np.maximum.reduceat(temps_sorted, starts),
+                'count': counts,
+            }, index=pd.Index(df['city'].cat.categories[codes_sorted[starts]], name='city'))
+        else:
+            # reduceat needs at least one element, so an empty frame gets an empty table
+            city_stats = pd.DataFrame(columns=['mean', 'min', 'max', 'count'], index=pd.Index([], name='city'))
         print(city_stats.round(2))
     
     print(f"\nOverall Mean Temperature: {df['temperature'].mean():.2f}")
@@ -80,108 +69,114 @@ def statistical_summary(df):
     print("\nQuartiles:")
     print(df["temperature"].quantile([0.25, 0.5, 0.75]))
 
-def detect_anomalies(df):
-    
-    df["rolling_avg"] = df["temperature"].rolling(window=3).mean()
-
-    mean = df["temperature"].mean()
-    std = df["temperature"].std()
-
-    
-    conditions = [
-        (df["temperature"] > mean + 2 * std),
-        (df["temperature"] < mean - 2 * std)
-    ]
-    choices = ["High anomaly", "Low anomaly"]
-    
-    df["anomaly"] = np.select(conditions, choices, default="Normal")
+def detect_anomalies(df, window=3):
+    """
+    Returns the rolling average and anomaly label arrays for the temperature column.
+    """
+    # The kernel does no bounds checking, so reject windows it cannot handle up front
+    if not isinstance(window, (int, np.integer)) or window < 1:
+        raise ValueError("window must be an integer 1 or greater")
+    # Rolling average, mean/std and anomaly labels in one compiled kernel over the raw array,
+    # instead of going through pandas' rolling machinery
+    temperature = df["temperature"].to_numpy()
+    if temperature.dtype not in TEMPERATURE_DTYPES:
+        temperature = temperature.astype(np.float32)
+    rolling_avg, label_idx, anomaly_count = get_anomaly_kernel(temperature.dtype)(temperature, window)
 
-    
-    anomaly_count = df[df["anomaly"] != "Normal"].shape[0]
     print(f"\nNumber of anomalies detected: {anomaly_count}")
     
-    return df
+    return rolling_avg, ANOMALY_LABELS[label_idx]
 
 
 def classify_weather(df):
     """
-    Classifies the day based on temperature ranges.
+    Classifies the day based on temperature ranges, returning an array of labels.
     """
-    conditions = [
-        (df["temperature"] < 0),
-        (df["temperature"] >= 0) & (df["temperature"] < 10),
-        (df["temperature"] >= 10) & (df["temperature"] < 20),
-        (df["temperature"] >= 20) & (df["temperature"] < 30),
-        (df["temperature"] >= 30)
-    ]
-    choices = ["Very Cold", "Cold", "Mild", "Hot", "Very Hot"]
+    labels = np.array(["Very Cold", "Cold", "Mild", "Hot", "Very Hot"])
     
-    df["condition"] = np.select(conditions, choices, default="Unknown")
-    return df
+    # The bands are 10 degrees wide, so the label index is floor(t / 10) + 1 with t clamped to [-10, 30]:
+    # <0 -> 0, [0, 10) -> 1, ..., >=30 -> 4. Floor division keeps fractional readings in the right band,
+    # and clamping before dividing keeps +/-inf in the end bands.
+    temperature = df["temperature"].to_numpy()
+    code = (np.clip(temperature, -10, 30) // 10 + 1).astype(np.int8)
+    return labels[code]
 
 
 def visualize(df):
+    # Plotting libraries are slow to import, so only load them when plots are requested
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     sns.set_theme(style="whitegrid") 
 
+    # Draw every plot into one preallocated grid instead of creating a figure per plot
+    fig, axes = plt.subplots(3, 2, figsize=(16, 14))
+
     # Temperature trend over time
-    plt.figure(figsize=(12, 6))
+    ax = axes[0, 0]
     if 'city' in df.columns:
         # Plot separate lines for each city
-        for city in df['city'].unique()[:10]:  # Limit to first 10 cities for readability
-            city_data = df[df['city'] == city]
-            plt.plot(pd.to_datetime(city_data["date"]), city_data["temperature"], 
+        # Split the frame by city in a single pass instead of re-filtering it per city
+        for i, (city, city_data) in enumerate(df.groupby('city', sort=False, observed=True)):
+            if i >= 10:  # Limit to first 10 cities for readability
+                break
+            ax.plot(city_data["date"], city_data["temperature"], 
                     marker='o', linestyle='-', label=city)
-        plt.legend()
-        plt.title("Daily Temperature Change by City")
+        ax.legend()
+        ax.set_title("Daily Temperature Change by City")
     else:
-        plt.plot(pd.to_datetime(df["date"]), df["temperature"], marker='o', linestyle='-', color='b')
-        plt.title("Daily Temperature Change")
+        ax.plot(df["date"], df["temperature"], marker='o', linestyle='-', color='b')
+        ax.set_title("Daily Temperature Change")
     
-    plt.xlabel("Date")
-    plt.ylabel("Temperature (°C)")
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.show()
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Temperature (°C)")
+    ax.tick_params(axis='x', rotation=45)
 
     # Temperature distribution
-    plt.figure(figsize=(8, 5))
-    sns.boxplot(y=df["temperature"], color='lightblue')
-    plt.title("Temperature Distribution & Outliers")
-    plt.show()
+    ax = axes[0, 1]
+    sns.boxplot(y=df["temperature"], color='lightblue', ax=ax)
+    ax.set_title("Temperature Distribution & Outliers")
 
     # City comparison if available
+    ax = axes[1, 0]
     if 'city' in df.columns and df['city'].nunique() > 1:
-        plt.figure(figsize=(10, 6))
-        sns.boxplot(data=df, x="city", y="temperature")
-        plt.title("Temperature Distribution by City")
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.show()
+        sns.boxplot(data=df, x="city", y="temperature", ax=ax)
+        ax.set_title("Temperature Distribution by City")
+        ax.tick_params(axis='x', rotation=45)
+    else:
+        ax.set_axis_off()
 
     # Anomalies scatter plot
+    ax = axes[1, 1]
     if 'anomaly' in df.columns:
-        plt.figure(figsize=(10, 6))
         sns.scatterplot(
             data=df,
-            x=pd.to_datetime(df["date"]),
+            x="date",
             y="temperature",
             hue="anomaly",
             palette={"Normal": "green", "High anomaly": "red", "Low anomaly": "blue"},
             style="anomaly",
-            s=100
+            s=100,
+            ax=ax
         )
-        plt.title("Temperature Anomalies")
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.show()
+        ax.set_title("Temperature Anomalies")
+        ax.tick_params(axis='x', rotation=45)
+    else:
+        ax.set_axis_off()
     
     # Weather condition distribution
+    ax = axes[2, 0]
     if 'condition' in df.columns:
-        plt.figure(figsize=(8, 5))
-        sns.countplot(x="condition", data=df, order=["Very Cold", "Cold", "Mild", "Hot", "Very Hot"])
-        plt.title("Weather Condition Distribution")
-        plt.xticks(rotation=45)
-        plt.show()
+        sns.countplot(x="condition", data=df, order=["Very Cold", "Cold", "Mild", "Hot", "Very Hot"], ax=ax)
+        ax.set_title("Weather Condition Distribution")
+        ax.tick_params(axis='x', rotation=45)
+    else:
+        ax.set_axis_off()
+
+    axes[2, 1].set_axis_off()
+
+    fig.tight_layout()
+    plt.show()
 
 
 def main():
@@ -194,8 +189,10 @@ def main():
         return
     df = clean_weather_data(df)
     statistical_summary(df)
-    df = detect_anomalies(df)
-    df = classify_weather(df)
+    rolling_avg, anomaly = detect_anomalies(df)
+    condition = classify_weather(df)
+    # Add all derived columns in one step rather than one block insertion per column
+    df = df.assign(rolling_avg=rolling_avg, anomaly=anomaly, condition=condition)
     
     print("\nProcessed Data Sample (First 10 rows):")
     print(df.head(10))
@@ -1,119 +1,98 @@
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
+import numpy as np
 import json
 import re
 
 def get_turkish_cities():
-    """Extract Turkish cities from MGM weather service"""
+    """Extract Turkish cities from MGM weather service
+    
+    Returns (cities, mins, maxs) as parallel numpy arrays, so a city's
+    temperature range is looked up by its index rather than by name.
+    """
     # Use fallback list of major Turkish cities since scraping city names needs more specific parsing
-    cities = [
-        "İstanbul", "Ankara", "İzmir", "Bursa", "Antalya", 
-        "Adana", "Konya", "Gaziantep", "Mersin", "Diyarbakır",
-        "Kayseri", "Eskişehir", "Şanlıurfa", "Malatya", "Erzurum",
-        "Van", "Batman", "Elazığ", "İzmit", "Manisa",
-        "Sivas", "Kütahya", "Trabzon", "Sakarya", "Balıkesir", "Şırnak"
+    # City-specific temperature ranges (winter in Turkey)
+    city_temp_ranges = [
+        ("İstanbul", 3, 12),
+        ("Ankara", -5, 8),
+        ("İzmir", 6, 15),
+        ("Bursa", 2, 10),
+        ("Antalya", 8, 18),
+        ("Adana", 5, 16),
+        ("Konya", -8, 5),
+        ("Gaziantep", 0, 12),
+        ("Mersin", 7, 17),
+        ("Diyarbakır", -3, 8),
+        ("Kayseri", -10, 3),
+        ("Eskişehir", -6, 6),
+        ("Şanlıurfa", -1, 10),
+        ("Malatya", -8, 4),
+        ("Erzurum", -15, -2),
+        ("Van", -12, -1),
+        ("Batman", -5, 7),
+        ("Elazığ", -8, 3),
+        ("İzmit", 2, 11),
+        ("Manisa", 4, 13),
+        ("Sivas", -12, 0),
+        ("Kütahya", -4, 7),
+        ("Trabzon", 4, 11),
+        ("Sakarya", 1, 9),
+        ("Balıkesir", 3, 12),
+        ("Şırnak", -6, 6)
     ]
     
+    names, mins, maxs = zip(*city_temp_ranges)
+    cities = np.array(names, dtype=object)
+    
     print(f"Using predefined list of {len(cities)} major Turkish cities")
-    return cities
+    return cities, np.array(mins, dtype=np.int16), np.array(maxs, dtype=np.int16)
 
-def scrape_weather_for_city(city="İstanbul"):
-    """Scrape weather data for a specific city with improved data generation"""
-    # Try OpenWeatherMap-style API (free tier) or fallback to realistic simulation
-    data = []
+def scrape_weather(num_cities=10):
+    """Main function to scrape weather data"""
+    print("🌡️ Starting weather data collection...")
+    
+    # Get list of cities
+    cities, mins, maxs = get_turkish_cities()
+    
+    # Scrape weather for first few cities to avoid overwhelming the server
+    cities, mins, maxs = cities[:num_cities], mins[:num_cities], maxs[:num_cities]
+    
+    print(f"📊 Collecting data for {len(cities)} cities...")
     
     try:
-        # Try a simple weather API first
+        # Try OpenWeatherMap-style API (free tier) or fallback to realistic simulation
         # Note: In real scenario, you would get an API key from openweathermap.org
         url = f"http://api.openweathermap.org/data/2.5/forecast"
         
         # Since we don't have API key, we'll create realistic data based on city and season
-        print(f"Generating realistic weather data for {city}...")
+        print("Generating realistic weather data...")
         
-        from datetime import datetime, timedelta
-        import random
+        from datetime import datetime
         
-        # City-specific temperature ranges (winter in Turkey)
-        city_temp_ranges = {
-            "İstanbul": (3, 12),
-            "Ankara": (-5, 8),
-            "İzmir": (6, 15),
-            "Bursa": (2, 10),
-            "Antalya": (8, 18),
-            "Adana": (5, 16),
-            "Konya": (-8, 5),
-            "Gaziantep": (0, 12),
-            "Mersin": (7, 17),
-            "Diyarbakır": (-3, 8),
-            "Kayseri": (-10, 3),
-            "Eskişehir": (-6, 6),
-            "Şanlıurfa": (-1, 10),
-            "Malatya": (-8, 4),
-            "Erzurum": (-15, -2),
-            "Van": (-12, -1),
-            "Batman": (-5, 7),
-            "Elazığ": (-8, 3),
-            "İzmit": (2, 11),
-            "Manisa": (4, 13),
-            "Sivas": (-12, 0),
-            "Kütahya": (-4, 7),
-            "Trabzon": (4, 11),
-            "Sakarya": (1, 9),
-            "Balıkesir": (3, 12),
-            "Şırnak": (-6, 6)
-        }
-        
-        min_temp, max_temp = city_temp_ranges.get(city, (-10, 18))
+        rng = np.random.default_rng()
         
         # Generate 7-10 days of realistic weather data
-        num_days = random.randint(7, 10)
+        num_days = int(rng.integers(7, 11))
         
-        for i in range(num_days):
-            date = datetime.now() + timedelta(days=i)
-            
-            # Add some seasonal variation and daily fluctuation
-            base_temp = random.randint(min_temp, max_temp)
-            daily_variation = random.randint(-3, 3)
-            final_temp = base_temp + daily_variation
-            
-            data.append({
-                'city': city,
-                'date': date.strftime('%Y-%m-%d'),
-                'temperature': final_temp
-            })
+        # Draw the whole cities x days grid at once: each row uses its city's range,
+        # plus some daily fluctuation
+        base_temps = rng.integers(mins[:, None], maxs[:, None] + 1, size=(len(cities), num_days))
+        daily_variation = rng.integers(-3, 4, size=(len(cities), num_days))
+        dates = pd.date_range(datetime.now().date(), periods=num_days, freq="D").strftime("%Y-%m-%d")
         
-        return pd.DataFrame(data)
+        # Flatten to long form, one row per city and day
+        combined_df = pd.DataFrame({
+            "city": np.repeat(cities, num_days),
+            "date": np.tile(dates.to_numpy(dtype=object), len(cities)),
+            "temperature": (base_temps + daily_variation).ravel()
+        })
         
     except Exception as e:
-        print(f"Error generating data for {city}: {e}")
-        return pd.DataFrame()
-
-def scrape_weather():
-    """Main function to scrape weather data"""
-    print("🌡️ Starting weather data collection...")
-    
-    # Get list of cities
-    cities = get_turkish_cities()
-    all_data = []
-    
-    print(f"📊 Collecting data for {min(10, len(cities))} cities...")
-    
-    # Scrape weather for first few cities to avoid overwhelming the server
-    for i, city in enumerate(cities[:10], 1):  # Limit to 10 cities
-        print(f"[{i}/10] Fetching weather data for {city}...")
-        city_data = scrape_weather_for_city(city)
-        if not city_data.empty:
-            all_data.append(city_data)
-            print(f"✅ Successfully collected {len(city_data)} data points for {city}")
-        else:
-            print(f"❌ Failed to collect data for {city}")
-    
-    if all_data:
-        combined_df = pd.concat(all_data, ignore_index=True)
-        print(f"🎉 Successfully collected weather data for {len(all_data)} cities!")
-        print(f"📈 Total data points: {len(combined_df)}")
-        return combined_df
-    else:
+        print(f"Error generating weather data: {e}")
         print("⚠️ No data collected from any cities")
         return pd.DataFrame()
+    
+    print(f"🎉 Successfully collected weather data for {len(cities)} cities!")
+    print(f"📈 Total data points: {len(combined_df)}")
+    return combined_df